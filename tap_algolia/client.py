@@ -3,23 +3,222 @@
 from __future__ import annotations
 
 import decimal
+import re
+import sys
+import threading
 import typing as t
-from datetime import date, datetime, timedelta
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import cached_property, lru_cache
 from importlib import resources
-from typing import Any, ClassVar, Dict, Iterable, List, Optional
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, Final, Iterable, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qs
 
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
 from singer_sdk.authenticators import APIKeyAuthenticator
 from singer_sdk.helpers.jsonpath import extract_jsonpath
-from singer_sdk.pagination import BaseOffsetPaginator
+from singer_sdk.pagination import (
+    BaseAPIPaginator,
+    BaseOffsetPaginator,
+    SinglePagePaginator,
+)
 from singer_sdk.streams import RESTStream
 
+from tap_algolia.schemas import load_schema
+
 if t.TYPE_CHECKING:
-    import requests
     from singer_sdk.helpers.types import Context
 
 
 # Schema directory for JSON schema files
-SCHEMAS_DIR = resources.files(__package__) / "schemas"
+SCHEMAS_DIR: Final = resources.files(__package__) / "schemas"
+
+
+def _number_fields(schema: dict) -> tuple[str, ...]:
+    """Return the top-level properties a schema types as JSON numbers.
+
+    Args:
+        schema: A stream JSON schema.
+
+    Returns:
+        The names of the number-typed properties.
+    """
+    return tuple(
+        name
+        for name, prop in schema.get("properties", {}).items()
+        if "number" in prop.get("type", ())
+    )
+
+
+def _floats_to_decimal(record: dict, fields: tuple[str, ...]) -> dict:
+    """Convert the float values of the given fields to Decimal in place.
+
+    orjson decodes JSON numbers as floats; going through repr() keeps the
+    shortest round-trip form, matching what ``parse_float=Decimal`` produced.
+
+    Args:
+        record: The record to update.
+        fields: Names of the fields that may hold floats.
+
+    Returns:
+        The updated record.
+    """
+    for field in fields:
+        value = record.get(field)
+        if isinstance(value, float):
+            record[field] = decimal.Decimal(repr(value))
+    return record
+
+
+def load_response_json(response: requests.Response) -> Any:
+    """Decode a response body, at most once per response.
+
+    The decoded body is memoized on the response so validation, parsing and
+    pagination can all share it.
+
+    Args:
+        response: The HTTP response object.
+
+    Returns:
+        The decoded JSON body.
+    """
+    data = getattr(response, "_tap_algolia_json", None)
+    if data is None:
+        data = orjson.loads(response.content)
+        response._tap_algolia_json = data
+    return data
+
+
+def _retry_after_seconds(exception: BaseException | None) -> float | None:
+    """Return how long a failed response asked the client to wait.
+
+    Args:
+        exception: The exception raised for the failed request.
+
+    Returns:
+        Seconds to wait per the response's Retry-After header, or None if the
+        failure carried no such header.
+    """
+    response = getattr(exception, "response", None)
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    # The header may also be an HTTP date
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _config_date(value: Any) -> date | None:
+    """Return a configured date or date-time setting as a date.
+
+    Settings normally arrive as ISO strings, but programmatic callers may
+    pass date or datetime objects, which are used without parsing.
+
+    Args:
+        value: The setting value.
+
+    Returns:
+        The date, or None if the setting is empty.
+    """
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value[:10])
+
+
+@lru_cache(maxsize=None)
+def _shared_session(pool_size: int) -> requests.Session:
+    """Return the process-wide session shared by all Algolia streams.
+
+    Pooling connections across streams and worker threads lets every request
+    after the first reuse an open TLS connection to the Algolia API.
+
+    Args:
+        pool_size: Connections kept open per host. Should be at least the
+            number of threads issuing requests, or surplus connections are
+            discarded after each request instead of being reused. Always
+            pass it positionally so equal sizes share one cached session.
+
+    Returns:
+        A requests session with a pooled HTTPS adapter.
+    """
+    # No adapter-level retries: the SDK's request backoff already retries
+    # 429/5xx responses and connection errors, waiting out Retry-After
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+# Context keys replaced by each request window in get_records
+_WINDOW_CONTEXT_KEYS: Final = frozenset({"start_date", "end_date", "date", "state"})
+
+# Matches records paths that just select every item of one top-level array
+_TOP_LEVEL_ARRAY_PATH: Final = re.compile(r"\$\.(\w+)\[\*\]")
+
+
+class AnalyticsOffsetPaginator(BaseOffsetPaginator):
+    """Offset paginator for the Analytics API.
+
+    The API has no next-page token, so a page shorter than the page size marks
+    the end of the data. That saves the trailing request for an empty page.
+    """
+
+    def __init__(
+        self,
+        start_value: int,
+        page_size: int,
+        records_key: str | None,
+        records_jsonpath: str,
+    ) -> None:
+        """Create a new paginator.
+
+        Args:
+            start_value: Initial offset.
+            page_size: Number of records requested per page.
+            records_key: Top-level response key holding the records array.
+            records_jsonpath: Records path, used when there is no key.
+        """
+        super().__init__(start_value=start_value, page_size=page_size)
+        self._records_key = records_key
+        self._records_jsonpath = records_jsonpath
+
+    def has_more(self, response: requests.Response) -> bool:
+        """Return whether the last page was full.
+
+        Args:
+            response: API response object.
+
+        Returns:
+            True if another page should be requested.
+        """
+        # Use the page size counted by parse_response when available
+        record_count = getattr(response, "_tap_algolia_record_count", None)
+        if record_count is None:
+            data = load_response_json(response)
+            if self._records_key is not None:
+                records = data.get(self._records_key) if isinstance(data, dict) else None
+                record_count = len(records) if isinstance(records, list) else 0
+            else:
+                record_count = sum(1 for _ in extract_jsonpath(self._records_jsonpath, data))
+        return record_count >= self._page_size
 
 
 class AlgoliaStream(RESTStream):
@@ -73,8 +272,7 @@ class AlgoliaStream(RESTStream):
         """
         return BaseOffsetPaginator(
             start_value=0,
-            page_size=getattr(self, "limit", 1000),  # Use the stream's limit attribute or default to 1000
-            increment=getattr(self, "limit", 1000),  # Page size determines increment
+            page_size=getattr(self, "limit", 1000),  # BaseOffsetPaginator advances the offset by page_size
         )
 
     def get_url_params(
@@ -117,11 +315,61 @@ class AlgoliaStream(RESTStream):
 class AlgoliaAnalyticsStream(RESTStream):
     """Base class for Algolia Analytics API streams."""
 
-    # Default date range for lookback if not in state
+    # Days fetched, ending yesterday, when there is no bookmark or start_date.
+    # Matches the widest date-metrics request window, so a first sync of
+    # those streams takes one request.
     default_date_window: ClassVar[int] = 30
     
     # No next_page_token_jsonpath by default; streams will set this if needed
     next_page_token_jsonpath = None
+
+    # Endpoint path; each concrete stream sets its own
+    path_template: ClassVar[str] = "/2/searches"
+
+    # Default page size for paginated endpoints
+    limit: ClassVar[int] = 1000
+
+    # Whether to request click analytics metrics
+    include_click_analytics: ClassVar[bool] = False
+
+    # Number of days requested per API call. Search endpoints aggregate over
+    # the requested range, so they must be fetched one day at a time.
+    batch_window_days: int = 1
+
+    # Top-level response key holding the records array. When set, records are
+    # read with a plain dict lookup instead of walking records_jsonpath.
+    records_key: ClassVar[Optional[str]] = None
+
+    # Whether the endpoint pages its records with limit/offset
+    paginated: ClassVar[bool] = True
+
+    # Fixed endpoint-specific query parameters sent with every request
+    extra_params: ClassVar[Mapping[str, str]] = MappingProxyType({})
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Derive records_key from a subclass's records_jsonpath.
+
+        A path of the form ``$.<key>[*]`` sets ``records_key`` unless the
+        subclass declares one, so records are read with a dict lookup. Any
+        other path clears an inherited ``records_key`` so the path is used.
+        """
+        super().__init_subclass__(**kwargs)
+        if "records_jsonpath" in vars(cls) and "records_key" not in vars(cls):
+            match = _TOP_LEVEL_ARRAY_PATH.fullmatch(cls.records_jsonpath)
+            cls.records_key = match.group(1) if match else None
+    
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the stream on the shared keep-alive session."""
+        super().__init__(*args, **kwargs)
+        self._requests_session = _shared_session(self._max_workers)
+        self._base_params_cache: dict[tuple | None, Mapping[str, Any]] = {}
+        self._tags: Optional[str] = self.config.get("tags")
+        self._sync_costs_lock = threading.Lock()
+        # The API caps limit at 1000 and silently returns fewer records above
+        # it, which the paginator would read as a short last page
+        self._page_limit: int = min(
+            self.config.get("analytics_page_size") or self.limit, self.limit
+        )
     
     def get_replication_key_signpost(
         self,
@@ -156,7 +404,7 @@ class AlgoliaAnalyticsStream(RESTStream):
             return None
         # Convert dates to string format if they aren't already
         if isinstance(value, (date, datetime)):
-            return value.isoformat().split('T')[0]  # Get just the YYYY-MM-DD part
+            return value.isoformat()[:10]  # Get just the YYYY-MM-DD part
         return str(value)
     
     @property
@@ -168,13 +416,50 @@ class AlgoliaAnalyticsStream(RESTStream):
         Returns:
             The path template.
         """
-        if not hasattr(self, "path_template"):
-            # Fallback in case no path_template exists
-            return "/2/searches"
-            
         return self.path_template
 
     @property
+    def schema(self) -> dict:
+        """Return the stream's JSON schema, loaded on first use.
+
+        Each stream's schema lives in ``schemas/<stream name>.json``; parsed
+        files are cached, so every access after the first is a dict lookup.
+
+        Returns:
+            The stream's JSON schema.
+        """
+        return load_schema(self.name)
+
+    @property
+    def partitions(self) -> list[dict] | None:
+        """Return one partition per configured index.
+
+        Every index in ``indices`` is synced, each with its own bookmark. The
+        context key matches the ``index_name`` record property, so the SDK
+        finds it in the catalog schema.
+
+        Returns:
+            A list of partition contexts.
+        """
+        return [{"index_name": index} for index in self.config.get("indices", [])]
+
+    @cached_property
+    def _max_workers(self) -> int:
+        """Return the number of request windows fetched concurrently."""
+        return max(self.config.get("max_parallel_days") or 8, 1)
+
+    @cached_property
+    def _default_date_range(self) -> tuple[str, str]:
+        """Return the default request window, computed once per stream.
+
+        Returns:
+            The (start, end) dates in ISO format, ending yesterday.
+        """
+        end_date = date.today() - timedelta(days=1)  # Use yesterday
+        start_date = end_date - timedelta(days=self.default_date_window - 1)
+        return start_date.isoformat(), end_date.isoformat()
+
+    @cached_property
     def url_base(self) -> str:
         """Return the Analytics API URL root for the configured region.
 
@@ -186,9 +471,9 @@ class AlgoliaAnalyticsStream(RESTStream):
             return "https://analytics.de.algolia.com"
         return "https://analytics.us.algolia.com"  # Default to US
 
-    @property
+    @cached_property
     def authenticator(self) -> APIKeyAuthenticator:
-        """Return a new authenticator object for Algolia Analytics API.
+        """Return the Analytics API authenticator, created once per stream.
 
         Returns:
             An authenticator instance with appropriate headers.
@@ -201,7 +486,7 @@ class AlgoliaAnalyticsStream(RESTStream):
             location="header",
         )
         
-    @property
+    @cached_property
     def http_headers(self) -> dict:
         """Return the http headers needed for Algolia.
 
@@ -227,13 +512,57 @@ class AlgoliaAnalyticsStream(RESTStream):
         Returns:
             URL query parameters including date range and optional pagination.
         """
+        # Only the offset changes between pages of the same day
+        params = dict(self._base_params_for(context))
+        
+        # Add offset for pagination; the API already defaults to the first page
+        if next_page_token:
+            params["offset"] = next_page_token
+            
+        # Log the parameters for debugging
+        self.logger.debug("%s request parameters: %s", self.name, params)
+            
+        return params
+
+    def _base_params_for(self, context: dict | None) -> Mapping[str, Any]:
+        """Return the page-independent URL parameters for a context.
+
+        The parameters are built on the first page of each (index, day) and
+        reused for the remaining pages.
+
+        Args:
+            context: The stream context.
+
+        Returns:
+            A read-only mapping of URL query parameters without the offset.
+        """
+        key = (
+            (context.get("index_name"), context.get("start_date"), context.get("end_date"))
+            if context
+            else None
+        )
+        base = self._base_params_cache.get(key)
+        if base is None:
+            base = MappingProxyType(self._build_base_params(context))
+            self._base_params_cache[key] = base
+        return base
+
+    def _build_base_params(self, context: dict | None) -> dict[str, Any]:
+        """Build the page-independent URL parameters for a context.
+
+        Args:
+            context: The stream context.
+
+        Returns:
+            URL query parameters including index, date range and page size.
+        """
         params: dict = {}
         
         # Add index parameter - REQUIRED for Analytics API V2
         # Get index from context or config
         index = None
         if context:
-            index = context.get("index")
+            index = context.get("index_name")
         if not index:
             indices = self.config.get("indices", [])
             if indices:
@@ -245,6 +574,7 @@ class AlgoliaAnalyticsStream(RESTStream):
         params["index"] = index
         
         # Add date range parameters
+        default_start, default_end = self._default_date_range
         if context and "start_date" in context:
             params["startDate"] = context["start_date"]
             
@@ -252,42 +582,44 @@ class AlgoliaAnalyticsStream(RESTStream):
                 params["endDate"] = context["end_date"]
             else:
                 # No end_date in context, use yesterday
-                params["endDate"] = (date.today() - timedelta(days=1)).isoformat()
+                params["endDate"] = default_end
         else:
             # Default to last 30 days ending yesterday if no specific dates provided
-            end_date = date.today() - timedelta(days=1)  # Use yesterday
-            start_date = end_date - timedelta(days=self.default_date_window)
-            params["startDate"] = start_date.isoformat()
-            params["endDate"] = end_date.isoformat()
-            self.logger.info(f"Using default date range: {start_date.isoformat()} to {end_date.isoformat()} (yesterday)")
+            params["startDate"] = default_start
+            params["endDate"] = default_end
+            self.logger.info("Using default date range: %s to %s (yesterday)", default_start, default_end)
             
         # Add clickAnalytics parameter for streams that support it
-        if getattr(self, "include_click_analytics", False):
+        if self.include_click_analytics:
             params["clickAnalytics"] = "true"
         
         # Add tags parameter if provided in the config
-        tags = self.config.get("tags")
-        if tags:
-            params["tags"] = tags
+        if self._tags:
+            params["tags"] = self._tags
             
-        # Handle pagination
-        # Get pagination limit from stream or use default
-        limit = getattr(self, "limit", 1000)
-        params["limit"] = limit
+        # Page size only applies to endpoints that paginate
+        if self.paginated:
+            params["limit"] = self._page_limit
+
+        params.update(self.extra_params)
         
-        # Add offset for pagination
-        if next_page_token:
-            params["offset"] = next_page_token
-        else:
-            params["offset"] = 0
-            
-        # Log the parameters for debugging
-        self.logger.info(f"{self.name} request parameters: {params}")
-            
         return params
 
-    # We don't need get_next_page_token anymore since we're using BaseOffsetPaginator
-    # The paginator will handle offset calculation based on the API response size
+    def get_new_paginator(self) -> BaseAPIPaginator:
+        """Create a new offset-based pagination helper instance.
+
+        Returns:
+            An offset paginator that stops after the first short page, or a
+            single-page paginator for endpoints that return everything at once.
+        """
+        if not self.paginated:
+            return SinglePagePaginator()
+        return AnalyticsOffsetPaginator(
+            start_value=0,
+            page_size=self._page_limit,
+            records_key=self.records_key,
+            records_jsonpath=self.records_jsonpath,
+        )
 
     def parse_response(self, response: requests.Response) -> Iterable[dict]:
         """Parse Analytics API response and add index name and date info.
@@ -298,48 +630,75 @@ class AlgoliaAnalyticsStream(RESTStream):
         Yields:
             Records from the response with additional context.
         """
-        data = response.json(parse_float=decimal.Decimal)
-        
         # Get URL parameters to determine index
-        url_parts = response.request.url.split('?', 1)
-        url_params = {}
-        if len(url_parts) > 1:
-            param_str = url_parts[1]
-            for p in param_str.split('&'):
-                if '=' in p:
-                    k, v = p.split('=', 1)
-                    url_params[k] = v
+        _, _, query = response.request.url.partition("?")
+        url_params = parse_qs(query)
         
-        # Get index name from URL parameters
-        index_name = url_params.get('index', 'unknown')
+        # Get index name from URL parameters; this and the dates are interned
+        # so all pages and windows share one string object per value
+        index_name = sys.intern(url_params.get("index", ["unknown"])[0])
         
         # Context for date ranges
         context = {}
         if "startDate" in url_params:
-            context["start_date"] = url_params["startDate"]
+            context["start_date"] = sys.intern(url_params["startDate"][0])
         if "endDate" in url_params:
-            context["end_date"] = url_params["endDate"]
+            context["end_date"] = sys.intern(url_params["endDate"][0])
             
-        # Use jsonpath to extract the records using the stream's defined records_jsonpath
-        for record in extract_jsonpath(self.records_jsonpath, data):
+        data = load_response_json(response)
+        
+        # Read the records array directly when the stream declares its key,
+        # otherwise fall back to records_jsonpath
+        if self.records_key is not None:
+            records = data.get(self.records_key, ())
+        else:
+            records = extract_jsonpath(self.records_jsonpath, data)
+
+        record_count = 0
+        for record in records:
+            record_count += 1
             if isinstance(record, dict):
-                # Make a copy of the record to avoid modifying the original
-                enriched_record = dict(record)
-                
-                # Add index_name if not present
-                if "index_name" not in enriched_record:
-                    enriched_record["index_name"] = index_name
-                
-                # Add date range context
-                enriched_record.update(context)
-                
-                yield enriched_record
-                
+                # Records are fresh subtrees of this response's body with no
+                # other consumers, so enrich them in place rather than copying
+                record.setdefault("index_name", index_name)
+                record.update(context)
+                yield record
+        
+        # Let the paginator check for a short page without re-reading the body
+        response._tap_algolia_record_count = record_count
+
+    @cached_property
+    def _decimal_fields(self) -> tuple[str, ...]:
+        """Return the number fields that post_process converts to Decimal.
+
+        Returns:
+            The names of the stream's number-typed properties.
+        """
+        return _number_fields(self.schema)
+
+    def post_process(
+        self,
+        row: dict,
+        context: Context | None = None,
+    ) -> dict | None:
+        """Convert float fields decoded by orjson to Decimal.
+
+        Args:
+            row: Individual record in the stream.
+            context: The stream context.
+
+        Returns:
+            The updated record.
+        """
+        return _floats_to_decimal(row, self._decimal_fields)
+
     def get_records(self, context: Dict | None = None) -> Iterable[Dict]:
         """Get records using the Analytics API with date range support.
         
-        Instead of getting a large date range in one request, this method
-        makes daily requests for better control and error handling.
+        The date range is split into windows of ``batch_window_days`` days and
+        each window is requested separately. Streams whose responses are
+        bucketed by date use wide windows; search streams request one day at
+        a time so every record belongs to a single date.
         
         Args:
             context: Stream context object, can contain start_date and end_date.
@@ -349,118 +708,288 @@ class AlgoliaAnalyticsStream(RESTStream):
         """
         # Get end date (default is yesterday, not today)
         end_date = date.today() - timedelta(days=1)  # Process data up to yesterday
-        self.logger.info(f"Using end date: {end_date.isoformat()} (yesterday)")
         
-        # Get start date (default is N days before end date)
-        start_date = end_date - timedelta(days=self.default_date_window)
+        # Get start date (default is the last N days, inclusive)
+        start_date = end_date - timedelta(days=self.default_date_window - 1)
         
-        # Check if we have a previous bookmark in state
-        if self.replication_key:
-            # Get the last processed date from state
-            replication_value = self.get_starting_replication_key_value(context)
-            if replication_value:
-                try:
-                    # Parse the date from the replication value
-                    last_date = datetime.strptime(replication_value, "%Y-%m-%d").date()
-                    # Start from the day after the last processed date
-                    start_date = last_date + timedelta(days=1)
-                    self.logger.info(f"Resuming from {start_date.isoformat()} (last state: {last_date.isoformat()})")
-                except (ValueError, TypeError):
-                    self.logger.info(f"Could not parse replication value: {replication_value}, using default window")
+        # Resume after the bookmark, or start on the configured start_date
+        resume_date = self._resolve_start_date(context)
+        if resume_date is not None:
+            start_date = resume_date
+            self.logger.debug("Resuming from %s", start_date)
                     
         # Override with context dates if provided
         if context and "start_date" in context:
             try:
-                start_date = datetime.strptime(context["start_date"], "%Y-%m-%d").date()
+                start_date = date.fromisoformat(context["start_date"])
             except ValueError:
-                self.logger.warning(f"Invalid start_date format in context: {context['start_date']}")
+                self.logger.warning("Invalid start_date format in context: %s", context["start_date"])
         
         if context and "end_date" in context:
             try:
                 # Even if a specific end_date is provided, ensure it's never later than yesterday
-                provided_end_date = datetime.strptime(context["end_date"], "%Y-%m-%d").date()
+                provided_end_date = date.fromisoformat(context["end_date"])
                 yesterday = date.today() - timedelta(days=1)
                 end_date = min(provided_end_date, yesterday)
                 if provided_end_date > yesterday:
-                    self.logger.info(f"Provided end_date {provided_end_date.isoformat()} is in the future, "
-                                    f"using yesterday ({yesterday.isoformat()}) instead")
+                    self.logger.info(
+                        "Provided end_date %s is in the future, using yesterday (%s) instead",
+                        provided_end_date,
+                        yesterday,
+                    )
                 else:
-                    self.logger.info(f"Using provided end_date: {end_date.isoformat()}")
+                    self.logger.info("Using provided end_date: %s", end_date)
             except ValueError:
-                self.logger.warning(f"Invalid end_date format in context: {context['end_date']}")
+                self.logger.warning("Invalid end_date format in context: %s", context["end_date"])
             
         # Skip if start date is after end date
         if start_date > end_date:
-            self.logger.info(f"Start date {start_date.isoformat()} is after end date {end_date.isoformat()}, skipping extraction")
+            self.logger.info("Start date %s is after end date %s, skipping extraction", start_date, end_date)
             return
             
         # Calculate date range
         delta = end_date - start_date
-        self.logger.info(f"Date range for extraction: {start_date.isoformat()} to {end_date.isoformat()} ({delta.days + 1} days)")
+        self.logger.info(
+            "Date range for extraction: %s to %s (%d days)",
+            start_date,
+            end_date,
+            delta.days + 1,
+        )
         
-        # Process each day in the range
-        for i in range(delta.days + 1):
-            current_date = start_date + timedelta(days=i)
-            
-            # Create a context for this specific day
-            day_context = {
-                "start_date": current_date.isoformat(),
-                "end_date": current_date.isoformat(),
-                "date": current_date.isoformat(),
-            }
-            
-            # Copy other values from the original context
-            if context:
-                for key, value in context.items():
-                    if key not in ["start_date", "end_date", "date", "state"]:
-                        day_context[key] = value
-            
-            # Log current day being processed
-            self.logger.info(f"Processing day: {current_date.isoformat()}")
-            
-            # Get records for this day using the REST stream logic with retry logic
-            max_retries = 5
-            retry_count = 0
-            retry_delay = 1  # seconds
-            
-            while retry_count < max_retries:
-                try:
-                    # Get records for this day using the REST stream logic
-                    record_count = 0
-                    for record in super().get_records(day_context):
-                        # Ensure date field is present and is a string
-                        if "date" not in record:
-                            record["date"] = current_date.isoformat()
-                        elif not isinstance(record["date"], str):
-                            record["date"] = record["date"].isoformat() if hasattr(record["date"], "isoformat") else str(record["date"])
-                        
-                        record_count += 1
-                        yield record
-                    
-                    # Log successful processing
-                    self.logger.info(f"Processed {record_count} records for {current_date.isoformat()}")
-                    
-                    # Break out of retry loop on success
-                    break
-                    
-                except ConnectionResetError as e:
-                    retry_count += 1
-                    if retry_count < max_retries:
-                        # Exponential backoff
-                        sleep_time = retry_delay * (2 ** (retry_count - 1))
-                        self.logger.warning(
-                            f"Connection reset when processing {current_date.isoformat()}. "
-                            f"Retrying in {sleep_time} seconds... (Attempt {retry_count}/{max_retries})"
-                        )
-                        import time
-                        time.sleep(sleep_time)
-                    else:
-                        self.logger.error(
-                            f"Failed to process {current_date.isoformat()} after {max_retries} attempts. "
-                            f"Last error: {str(e)}"
-                        )
-                        # Re-raise the exception after max retries
-                        raise
-                except Exception as e:
-                    self.logger.error(f"Error processing {current_date.isoformat()}: {str(e)}")
-                    raise
\ No newline at end of file
+        # Carry over the caller's context once; only the dates vary per window
+        base_context = {
+            key: value
+            for key, value in (context or {}).items()
+            if key not in _WINDOW_CONTEXT_KEYS
+        }
+        
+        # Build a context for each request window in the range
+        window_contexts = []
+        for offset in range(0, delta.days + 1, self.batch_window_days):
+            window_start = start_date + timedelta(days=offset)
+            window_end = min(window_start + timedelta(days=self.batch_window_days - 1), end_date)
+            window_start_iso = sys.intern(window_start.isoformat())
+            window_contexts.append(
+                {
+                    **base_context,
+                    "start_date": window_start_iso,
+                    "end_date": window_end.isoformat(),
+                    "date": window_start_iso,
+                }
+            )
+        
+        # Fetch windows concurrently, keeping at most max_workers in flight
+        # so only a bounded number of fetched windows wait in memory. Futures
+        # are drained in submission order, so records are still emitted in
+        # ascending date order and the replication bookmark only moves forward.
+        #
+        # Workers only run the SDK's request/parse path. Each call builds its
+        # own paginator and request counter, the pooled session is safe to
+        # share, and the one piece of shared stream state they write, the
+        # sync costs, is updated under a lock. Records, state and metrics for
+        # the stream are all handled on this thread.
+        max_workers = self._max_workers
+        record_count = 0
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            pending: deque[Future[List[dict]]] = deque()
+            for window_context in window_contexts:
+                pending.append(executor.submit(self._fetch_window, window_context))
+                if len(pending) >= max_workers:
+                    records = pending.popleft().result()
+                    record_count += len(records)
+                    yield from records
+            while pending:
+                records = pending.popleft().result()
+                record_count += len(records)
+                yield from records
+        except BaseException:
+            # Fail fast on an error or an abandoned generator: drop windows
+            # that have not started instead of waiting for all of them
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+        
+        # One summary line per sync instead of per-window progress logs
+        self.logger.info(
+            "Extracted %d records from %s to %s in %d request windows",
+            record_count,
+            start_date,
+            end_date,
+            len(window_contexts),
+        )
+
+    def _resolve_start_date(self, context: Dict | None) -> Optional[date]:
+        """Return the first date to fetch for a context.
+
+        A state bookmark is the last date already synced, so extraction
+        resumes the day after it. Without one, the configured start_date is
+        itself the first date to fetch.
+
+        Args:
+            context: Stream context object.
+
+        Returns:
+            The first date to fetch, or None to use the default lookback.
+        """
+        if not self.replication_key:
+            return None
+        bookmark = self.get_context_state(context).get("replication_key_value")
+        if not bookmark and self._is_first_index(context):
+            # Before per-index partitions, only the first index was synced and
+            # its bookmark was kept at the stream level
+            bookmark = self.stream_state.get("replication_key_value")
+        if bookmark:
+            try:
+                return date.fromisoformat(str(bookmark)[:10]) + timedelta(days=1)
+            except ValueError:
+                self.logger.info("Could not parse replication value: %s, using default window", bookmark)
+                return None
+        return _config_date(self.config.get("start_date"))
+
+    def backoff_wait_generator(self) -> t.Generator[float, Any, None]:
+        """Wait out a failed response's Retry-After before retrying.
+
+        Rate-limited (429) responses say how long to wait; other failures
+        back off exponentially as the SDK does by default.
+
+        Yields:
+            Seconds to wait before each retry.
+        """
+        exception = yield  # type: ignore[misc]  # Primed by the backoff decorator
+        attempt = 0
+        while True:
+            wait = _retry_after_seconds(exception)
+            if wait is None:
+                wait = 2 * 2**attempt  # The SDK's backoff.expo(factor=2)
+            attempt += 1
+            exception = yield wait
+
+    def update_sync_costs(
+        self,
+        request: requests.PreparedRequest,
+        response: requests.Response,
+        context: Context | None,
+    ) -> dict[str, int]:
+        """Update the sync costs, serializing updates from worker threads.
+
+        Args:
+            request: The request that was just sent.
+            response: The response to the request.
+            context: The stream context.
+
+        Returns:
+            The accumulated sync costs.
+        """
+        with self._sync_costs_lock:
+            return super().update_sync_costs(request, response, context)
+
+    def _is_first_index(self, context: Dict | None) -> bool:
+        """Return whether a context is for the first configured index.
+
+        Args:
+            context: Stream context object.
+
+        Returns:
+            True if the context's index is the first entry of ``indices``.
+        """
+        if not context:
+            return False
+        indices = self.config.get("indices") or [None]
+        return context.get("index_name") == indices[0]
+
+    def _fetch_window(self, window_context: dict) -> List[dict]:
+        """Fetch all records for a single request window.
+
+        Transient failures are retried per request by the SDK's backoff, so a
+        dropped connection mid-pagination never restarts the window from its
+        first page.
+
+        Args:
+            window_context: Stream context for the window, including its dates.
+
+        Returns:
+            The records for the window.
+        """
+        window_start = window_context["start_date"]
+        window_end = window_context["end_date"]
+        
+        # Log current window being processed
+        self.logger.debug("Processing window: %s to %s", window_start, window_end)
+        
+        try:
+            # Get records for this window using the REST stream logic
+            records = []
+            seen = set()
+            primary_keys = self.primary_keys or ()
+            for record in super().get_records(window_context):
+                # JSON decoding only ever yields dates as strings, so the
+                # field just needs filling in when the API leaves it out
+                record["date"] = record.get("date") or window_start
+                
+                # Rankings can shift between offset pages, repeating a row
+                # at a page boundary; emit each primary key once per window
+                if primary_keys:
+                    key = tuple(record.get(name) for name in primary_keys)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                
+                records.append(record)
+        except Exception as e:
+            self.logger.error("Error processing %s to %s: %s", window_start, window_end, e)
+            raise
+        
+        # Log successful processing
+        self.logger.debug("Processed %d records for %s to %s", len(records), window_start, window_end)
+        
+        return records
+
+
+class AlgoliaDateMetricsStream(AlgoliaAnalyticsStream):
+    """Base class for metrics returned as a daily breakdown of a date range."""
+
+    primary_keys: ClassVar[Tuple[str, ...]] = ("index_name", "date")
+    replication_key = "date"
+    records_key = "dates"  # Path to the daily breakdown data
+
+    # Responses are already bucketed by date, so each request covers up to
+    # date_window_size days
+    max_window_days: ClassVar[int] = 30
+    paginated = False  # Every date bucket arrives in a single response
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the stream with the configured request window."""
+        super().__init__(*args, **kwargs)
+        window_days = self.config.get("date_window_size") or self.max_window_days
+        self.batch_window_days = min(max(window_days, 1), self.max_window_days)
+
+    def post_process(
+        self,
+        row: dict,
+        context: Context | None = None,
+    ) -> dict | None:
+        """Report each daily bucket's own date as its start and end date.
+
+        Args:
+            row: Individual record in the stream.
+            context: The stream context.
+
+        Returns:
+            The updated record.
+        """
+        # A request now spans several days, but each bucket covers one. A
+        # bucket without a date keeps the window bounds; _fetch_window then
+        # defaults its date to the window start.
+        day = row.get("date")
+        if day:
+            row["start_date"] = row["end_date"] = day
+        return super().post_process(row, context)
+
+
+class AlgoliaSearchesStream(AlgoliaAnalyticsStream):
+    """Base class for per-search rankings, requested one day at a time."""
+
+    primary_keys: ClassVar[Tuple[str, ...]] = ("index_name", "search", "date")
+    replication_key = "date"  # Using date field for state management
+    records_key = "searches"  # Path to the search records in response
@@ -1,18 +1,23 @@
 """Algolia schemas module."""
 
-from pathlib import Path
-import json
+from functools import lru_cache
+from importlib import resources
 
+import orjson
 
+
+@lru_cache(maxsize=None)
 def load_schema(stream_name: str) -> dict:
     """Load a schema file.
 
+    Schemas are read-only package data, so each file is read and parsed at
+    most once per process.
+
     Args:
         stream_name: The name of the stream/schema file.
 
     Returns:
         The schema dictionary.
     """
-    schema_path = Path(__file__).parent / f"{stream_name}.json"
-    with open(schema_path, "r") as f:
-        return json.load(f)
+    schema_file = resources.files(__package__).joinpath(f"{stream_name}.json")
+    return orjson.loads(schema_file.read_bytes())
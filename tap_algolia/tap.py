@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
 from typing import List
 
 from singer_sdk import Tap
 from singer_sdk import typing as th  # JSON schema typing helpers
 
 from tap_algolia import streams
+from tap_algolia.client import AlgoliaAnalyticsStream
 
 
 class TapAlgolia(Tap):
@@ -79,10 +79,28 @@ class TapAlgolia(Tap):
         ),
         th.Property(
             "date_window_size",
-            th.IntegerType(nullable=True),
+            th.IntegerType(nullable=True, minimum=1, maximum=30),
             default=30,
             title="Date Window Size",
-            description="Number of days to include in each API request (max 30)",
+            description=(
+                "Number of days covered by each request of the daily count and "
+                "rate streams (max 30); search rankings are always requested "
+                "one day at a time"
+            ),
+        ),
+        th.Property(
+            "max_parallel_days",
+            th.IntegerType(nullable=True, minimum=1),
+            default=8,
+            title="Max Parallel Days",
+            description="Maximum number of days to request concurrently per stream",
+        ),
+        th.Property(
+            "analytics_page_size",
+            th.IntegerType(nullable=True, minimum=1, maximum=1000),
+            default=1000,
+            title="Analytics Page Size",
+            description="Number of records requested per page from paginated endpoints (max 1000)",
         ),
         th.Property(
             "user_agent",
@@ -94,7 +112,7 @@ class TapAlgolia(Tap):
         ),
     ).to_dict()
 
-    def discover_streams(self) -> list[streams.AlgoliaAnalyticsStream]:
+    def discover_streams(self) -> list[AlgoliaAnalyticsStream]:
         """Return a list of discovered streams.
 
         Returns:
@@ -106,7 +124,7 @@ class TapAlgolia(Tap):
             raise ValueError("No indices specified in configuration. At least one index is required.")
             
         # Initialize our Analytics API streams
-        analytics_streams: List[streams.AlgoliaAnalyticsStream] = [
+        analytics_streams: List[AlgoliaAnalyticsStream] = [
             streams.UsersCountStream(self),
             streams.TopSearchesStream(self),
             streams.SearchesCountStream(self),
@@ -118,30 +136,6 @@ class TapAlgolia(Tap):
         ]
         
         return analytics_streams
-    
-    def get_starting_dates(self, config):
-        """Calculate start and end dates based on config or defaults.
-        
-        Args:
-            config: Tap configuration.
-            
-        Returns:
-            Tuple of (start_date, end_date) as strings in YYYY-MM-DD format.
-        """
-        # Get end date from config or use today
-        if config.get("end_date"):
-            end_date = datetime.strptime(config["end_date"], "%Y-%m-%d").date()
-        else:
-            end_date = datetime.now().date()
-            
-        # Get start date from config or use default window
-        if config.get("start_date"):
-            start_date = datetime.strptime(config["start_date"], "%Y-%m-%d").date()
-        else:
-            window_size = config.get("date_window_size", 30)
-            start_date = end_date - timedelta(days=window_size)
-            
-        return start_date.isoformat(), end_date.isoformat()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+"""Shared fixtures for tap-algolia tests."""
+
+from __future__ import annotations
+
+import json
+import threading
+import typing as t
+from datetime import timedelta
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests
+
+from tap_algolia.tap import TapAlgolia
+
+BASE_CONFIG = {"application_id": "app", "api_key": "key", "indices": ["idx"]}
+
+Handler = t.Callable[[str, t.Dict[str, str]], t.Any]
+
+
+class FakeAnalyticsAPI:
+    """Stand-in for the Analytics API that records every request it answers."""
+
+    def __init__(self, handler: Handler) -> None:
+        """Create a fake API.
+
+        Args:
+            handler: Called with the request path and query parameters; returns
+                the JSON body to respond with, or a (status, body, headers)
+                tuple for other responses.
+        """
+        self.handler = handler
+        self.calls: list[tuple[str, dict[str, str]]] = []
+        self._lock = threading.Lock()
+
+    def send(
+        self,
+        session: requests.Session,
+        request: requests.PreparedRequest,
+        **kwargs: t.Any,
+    ) -> requests.Response:
+        """Answer a prepared request in place of requests.Session.send.
+
+        Args:
+            session: The session sending the request.
+            request: The prepared request.
+            kwargs: Transport options, ignored.
+
+        Returns:
+            A response carrying the handler's JSON body.
+        """
+        url = urlsplit(request.url)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        with self._lock:
+            self.calls.append((url.path, params))
+        result = self.handler(url.path, params)
+        status, body, headers = result if isinstance(result, tuple) else (200, result, {})
+        response = requests.Response()
+        response.status_code = status
+        response.headers["Content-Type"] = "application/json"
+        response.headers.update(headers)
+        response.request = request
+        response.url = request.url
+        response.elapsed = timedelta(0)
+        response._content = json.dumps(body).encode()
+        return response
+
+
+@pytest.fixture
+def fake_api(monkeypatch: pytest.MonkeyPatch) -> t.Callable[[Handler], FakeAnalyticsAPI]:
+    """Return a function that routes all HTTP requests to a fake API."""
+
+    def install(handler: Handler) -> FakeAnalyticsAPI:
+        api = FakeAnalyticsAPI(handler)
+        monkeypatch.setattr(
+            requests.Session,
+            "send",
+            lambda session, request, **kwargs: api.send(session, request, **kwargs),
+        )
+        return api
+
+    return install
+
+
+@pytest.fixture
+def make_tap() -> t.Callable[..., TapAlgolia]:
+    """Return a factory for taps built from the base test config."""
+
+    def factory(state: dict | None = None, **config: t.Any) -> TapAlgolia:
+        return TapAlgolia(
+            config={**BASE_CONFIG, **config},
+            state=state or {},
+            parse_env_config=False,
+        )
+
+    return factory
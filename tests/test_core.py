@@ -1,22 +1,30 @@
 """Tests standard tap features using the built-in SDK tests library."""
 
 import datetime
+import os
 
+import pytest
 from singer_sdk.testing import get_tap_test_class
 
 from tap_algolia.tap import TapAlgolia
 
 SAMPLE_CONFIG = {
+    "application_id": os.environ.get("TAP_ALGOLIA_APPLICATION_ID"),
+    "api_key": os.environ.get("TAP_ALGOLIA_API_KEY"),
+    "indices": os.environ.get("TAP_ALGOLIA_INDICES", "").split(","),
     "start_date": datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d"),
-    # TODO: Initialize minimal tap config
 }
 
+# The built-in tests call the live API
+if not (SAMPLE_CONFIG["application_id"] and SAMPLE_CONFIG["api_key"]):
+    pytest.skip(
+        "TAP_ALGOLIA_APPLICATION_ID and TAP_ALGOLIA_API_KEY are not set",
+        allow_module_level=True,
+    )
+
 
 # Run standard built-in tap tests from the SDK:
 TestTapAlgolia = get_tap_test_class(
     tap_class=TapAlgolia,
     config=SAMPLE_CONFIG,
 )
-
-
-# TODO: Create additional tests as appropriate for your tap.
@@ -0,0 +1,325 @@
+"""Tests for the Analytics API stream base classes."""
+
+from __future__ import annotations
+
+import json
+import time
+import typing as t
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+import requests
+from singer_sdk.exceptions import ConfigValidationError
+
+from tap_algolia.client import AlgoliaSearchesStream, AnalyticsOffsetPaginator
+
+YESTERDAY = date.today() - timedelta(days=1)
+
+
+def searches_page(total: int):
+    """Return a handler serving ``total`` searches per day in limit/offset pages."""
+
+    def handler(path: str, params: dict[str, str]) -> dict:
+        offset = int(params.get("offset", 0))
+        count = max(0, min(int(params["limit"]), total - offset))
+        return {
+            "searches": [
+                {"search": f"q{offset + i}", "count": 1, "nbHits": 1}
+                for i in range(count)
+            ]
+        }
+
+    return handler
+
+
+def test_pages_past_a_full_page(fake_api, make_tap):
+    api = fake_api(searches_page(5))
+    stream = make_tap(analytics_page_size=2).streams["top_searches"]
+    day = YESTERDAY.isoformat()
+    context = {**stream.partitions[0], "start_date": day, "end_date": day}
+
+    records = list(stream.get_records(context))
+
+    assert [record["search"] for record in records] == [f"q{i}" for i in range(5)]
+    assert [params.get("offset") for _, params in api.calls] == [None, "2", "4"]
+    assert {params["limit"] for _, params in api.calls} == {"2"}
+
+
+def test_page_size_above_api_maximum_is_rejected(make_tap):
+    with pytest.raises(ConfigValidationError):
+        make_tap(analytics_page_size=5000)
+
+
+def test_config_start_date_is_synced_without_state(fake_api, make_tap):
+    fake_api(searches_page(1))
+    start = YESTERDAY - timedelta(days=2)
+    stream = make_tap(start_date=f"{start.isoformat()}T00:00:00Z").streams["top_searches"]
+
+    records = list(stream.get_records(stream.partitions[0]))
+
+    assert [record["date"] for record in records] == [
+        (start + timedelta(days=offset)).isoformat() for offset in range(3)
+    ]
+
+
+def test_state_bookmark_resumes_on_the_next_day(fake_api, make_tap):
+    fake_api(searches_page(1))
+    bookmark = YESTERDAY - timedelta(days=2)
+    tap = make_tap(
+        start_date="2020-01-01T00:00:00Z",
+        state={
+            "bookmarks": {
+                "top_searches": {
+                    "partitions": [
+                        {
+                            "context": {"index_name": "idx"},
+                            "replication_key": "date",
+                            "replication_key_value": bookmark.isoformat(),
+                        }
+                    ]
+                }
+            }
+        },
+    )
+    stream = tap.streams["top_searches"]
+
+    records = list(stream.get_records(stream.partitions[0]))
+
+    assert [record["date"] for record in records] == [
+        (bookmark + timedelta(days=1)).isoformat(),
+        YESTERDAY.isoformat(),
+    ]
+
+
+def test_bookmark_at_yesterday_fetches_nothing(fake_api, make_tap):
+    api = fake_api(searches_page(1))
+    tap = make_tap(
+        state={
+            "bookmarks": {
+                "top_searches": {
+                    "partitions": [
+                        {
+                            "context": {"index_name": "idx"},
+                            "replication_key": "date",
+                            "replication_key_value": YESTERDAY.isoformat(),
+                        }
+                    ]
+                }
+            }
+        },
+    )
+    stream = tap.streams["top_searches"]
+
+    assert list(stream.get_records(stream.partitions[0])) == []
+    assert api.calls == []
+
+
+def test_stream_level_bookmark_is_used_for_the_first_index(fake_api, make_tap):
+    fake_api(searches_page(1))
+    bookmark = YESTERDAY - timedelta(days=1)
+    tap = make_tap(
+        indices=["idx", "other"],
+        state={
+            "bookmarks": {
+                "top_searches": {
+                    "replication_key": "date",
+                    "replication_key_value": bookmark.isoformat(),
+                }
+            }
+        },
+    )
+    stream = tap.streams["top_searches"]
+    first, second = stream.partitions
+
+    assert first == {"index_name": "idx"}
+    assert [record["date"] for record in stream.get_records(first)] == [
+        YESTERDAY.isoformat()
+    ]
+    assert len(list(stream.get_records(second))) == stream.default_date_window
+
+
+def test_number_fields_are_emitted_as_decimals(fake_api, make_tap):
+    fake_api(lambda path, params: {"dates": [{"date": params["startDate"], "rate": 0.1}]})
+    stream = make_tap().streams["no_results_rate"]
+    day = YESTERDAY.isoformat()
+    context = {**stream.partitions[0], "start_date": day, "end_date": day}
+
+    (record,) = (stream.post_process(row) for row in stream.get_records(context))
+
+    assert record["rate"] == Decimal("0.1")
+
+
+@pytest.mark.parametrize(("window_size", "request_count"), [(30, 1), (7, 5), (1, 30)])
+def test_date_metrics_request_windows_follow_date_window_size(
+    fake_api, make_tap, window_size, request_count
+):
+    api = fake_api(lambda path, params: {"dates": [{"date": params["startDate"]}]})
+    stream = make_tap(date_window_size=window_size).streams["users_count"]
+
+    records = [
+        stream.post_process(row) for row in stream.get_records(stream.partitions[0])
+    ]
+
+    assert len(api.calls) == request_count
+    assert all(record["start_date"] == record["end_date"] == record["date"] for record in records)
+    spans = [
+        date.fromisoformat(params["endDate"]) - date.fromisoformat(params["startDate"])
+        for _, params in api.calls
+    ]
+    assert max(spans).days + 1 == window_size
+
+
+def test_records_jsonpath_override_replaces_inherited_records_key(fake_api, make_tap):
+    class NestedSearchesStream(AlgoliaSearchesStream):
+        name = "top_searches"
+        records_jsonpath = "$.result.searches[*]"
+
+    class FlatSearchesStream(AlgoliaSearchesStream):
+        name = "top_searches"
+        records_jsonpath = "$.hits[*]"
+
+    def handler(path: str, params: dict[str, str]) -> dict:
+        return {"result": searches_page(5)(path, params)}
+
+    api = fake_api(handler)
+    stream = NestedSearchesStream(make_tap(analytics_page_size=2))
+    day = YESTERDAY.isoformat()
+    context = {**stream.partitions[0], "start_date": day, "end_date": day}
+
+    assert NestedSearchesStream.records_key is None
+    assert FlatSearchesStream.records_key == "hits"
+    assert [record["search"] for record in stream.get_records(context)] == [
+        f"q{i}" for i in range(5)
+    ]
+    assert len(api.calls) == 3
+
+
+def test_streams_share_one_session_per_pool_size(make_tap):
+    first = make_tap().streams["top_searches"]
+    second = make_tap(max_parallel_days=8).streams["users_count"]
+
+    assert first.requests_session is second.requests_session
+
+
+def test_max_parallel_days_must_be_positive(make_tap):
+    with pytest.raises(ConfigValidationError):
+        make_tap(max_parallel_days=-1)
+
+
+def test_window_error_stops_the_sync(fake_api, make_tap):
+    def handler(path: str, params: dict[str, str]) -> dict:
+        raise ConnectionAbortedError(params["startDate"])
+
+    api = fake_api(handler)
+    stream = make_tap(max_parallel_days=4).streams["top_searches"]
+
+    with pytest.raises(ConnectionAbortedError):
+        list(stream.get_records(stream.partitions[0]))
+    assert len(api.calls) <= 4
+
+
+@pytest.mark.parametrize("records_key", ["searches", None])
+@pytest.mark.parametrize(("count", "expected"), [(2, True), (1, False), (0, False)])
+def test_paginator_continues_only_after_a_full_page(records_key, count, expected):
+    response = requests.Response()
+    response._content = json.dumps({"searches": [{}] * count}).encode()
+    paginator = AnalyticsOffsetPaginator(
+        start_value=0,
+        page_size=2,
+        records_key=records_key,
+        records_jsonpath="$.searches[*]",
+    )
+
+    assert paginator.has_more(response) is expected
+
+
+@pytest.mark.parametrize("max_parallel_days", [1, 3, 8, 40])
+def test_windows_are_emitted_in_date_order(fake_api, make_tap, max_parallel_days):
+    api = fake_api(searches_page(1))
+    stream = make_tap(max_parallel_days=max_parallel_days).streams["top_searches"]
+
+    dates = [record["date"] for record in stream.get_records(stream.partitions[0])]
+
+    expected = [
+        (YESTERDAY - timedelta(days=offset)).isoformat()
+        for offset in range(stream.default_date_window - 1, -1, -1)
+    ]
+    assert dates == expected
+    assert sorted(params["startDate"] for _, params in api.calls) == expected
+    assert all(params["startDate"] == params["endDate"] for _, params in api.calls)
+
+
+def test_window_repeats_across_pages_are_dropped(fake_api, make_tap):
+    def handler(path: str, params: dict[str, str]) -> dict:
+        # Rankings shifted between requests, repeating q1 on the second page
+        pages = {0: ["q0", "q1"], 2: ["q1", "q2"], 4: []}
+        searches = pages[int(params.get("offset", 0))]
+        return {"searches": [{"search": search} for search in searches]}
+
+    fake_api(handler)
+    stream = make_tap(analytics_page_size=2).streams["top_searches"]
+    day = YESTERDAY.isoformat()
+    context = {**stream.partitions[0], "start_date": day, "end_date": day}
+
+    assert [record["search"] for record in stream.get_records(context)] == [
+        "q0",
+        "q1",
+        "q2",
+    ]
+
+
+def test_rate_limited_requests_wait_for_retry_after(fake_api, make_tap, monkeypatch):
+    waits = []
+    monkeypatch.setattr(time, "sleep", waits.append)
+    responses = iter([(429, {"message": "Too Many Requests"}, {"Retry-After": "7"})])
+
+    def handler(path: str, params: dict[str, str]) -> t.Any:
+        return next(responses, {"searches": [{"search": "q"}]})
+
+    api = fake_api(handler)
+    stream = make_tap().streams["top_searches"]
+    day = YESTERDAY.isoformat()
+    context = {**stream.partitions[0], "start_date": day, "end_date": day}
+
+    assert [record["search"] for record in stream.get_records(context)] == ["q"]
+    assert len(api.calls) == 2
+    assert len(waits) == 1
+    assert 7 <= waits[0] < 8  # Retry-After plus the SDK's jitter
+
+
+def test_failures_without_retry_after_back_off_exponentially(make_tap):
+    stream = make_tap().streams["top_searches"]
+    waits = stream.backoff_wait_generator()
+    next(waits)
+
+    assert [waits.send(requests.ConnectionError()) for _ in range(3)] == [2, 4, 8]
+
+
+def test_date_bucket_without_a_date_takes_the_window_start(fake_api, make_tap):
+    fake_api(lambda path, params: {"dates": [{"count": 3}]})
+    stream = make_tap(date_window_size=7).streams["users_count"]
+    start = YESTERDAY - timedelta(days=6)
+    context = {
+        **stream.partitions[0],
+        "start_date": start.isoformat(),
+        "end_date": YESTERDAY.isoformat(),
+    }
+
+    (record,) = stream.get_records(context)
+
+    assert record["date"] == start.isoformat()
+    assert record["count"] == 3
+
+
+def test_streams_without_primary_keys_keep_every_record(fake_api, make_tap):
+    class KeylessSearchesStream(AlgoliaSearchesStream):
+        name = "top_searches"
+        primary_keys = None
+
+    fake_api(searches_page(3))
+    stream = KeylessSearchesStream(make_tap())
+    day = YESTERDAY.isoformat()
+    context = {**stream.partitions[0], "start_date": day, "end_date": day}
+
+    assert len(list(stream.get_records(context))) == 3